@@ -0,0 +1,192 @@
+import os
+import json
+from pathlib import Path
+
+import pandas as pd
+import numpy as np
+from scipy import sparse
+
+
+# 문서 단위별 문서 key 생성 함수
+# corpus/*.json 의 문장 레코드: {"id", "text", "tokens", "pos_tags", "metadata"}
+#   - 수능: metadata = {source, year, month, note, gender, type}
+#   - 교과서: metadata = {source, note, type}, note = "단원 단원명 본문제목 / 비고"
+def _year_key(record: dict) -> str:
+    # 시험 년도 기준. 년도가 없는 교과서 문장은 교과서(출처) 단위로 묶음
+    metadata = record['metadata']
+    if 'year' in metadata:
+        return str(metadata['year'])
+    return f"{metadata['type']}_{metadata['source']}"
+
+
+def _source_key(record: dict) -> str:
+    # 출처 기준 (수능 / 모의 / 교과서명)
+    metadata = record['metadata']
+    return f"{metadata['type']}_{metadata['source']}"
+
+
+def _passage_key(record: dict) -> str:
+    # 지문 기준. id는 원본 엑셀의 행 번호라 corpus type 내에서만 유일함
+    return f"{record['metadata']['type']}_{record['id']}"
+
+
+def _unit_key(record: dict) -> str:
+    # 교과서는 단원 기준, 수능은 한 회차 시험지(년도, 월, 출처) 기준
+    metadata = record['metadata']
+    if 'year' in metadata:
+        return f"{metadata['type']}_{metadata['year']}_{metadata['month']}_{metadata['source']}"
+    unit = metadata['note'].split(' ')[0]
+    return f"{metadata['type']}_{metadata['source']}_{unit}"
+
+
+DOCUMENT_KEYS = {
+    'year': _year_key,
+    'source': _source_key,
+    'passage': _passage_key,
+    'unit': _unit_key,
+}
+
+
+class DispersionAnalyzer:
+    def __init__(self, records: list, document_unit='passage', suffix: str = '_CSAT'):
+        """
+        단어 분산도(dispersion) 분석 클래스
+        빈도수만으로는 여러 해에 고루 등장한 단어와 한 지문에 몰려 등장한 단어를 구분할 수 없기 때문에,
+        희소(CSR) 문서-단어 행렬을 만들어 Juilland's D, Gries' DP, range, 조정 빈도(Juilland's U)를 계산한다.
+
+        Parameters:
+        records: corpus/*.json 에서 읽어온 문장 레코드 리스트
+        document_unit: 문서 단위 ('year', 'source', 'passage', 'unit') 또는 record -> key 함수
+        suffix: 결과 컬럼명 접미사 (merged_corpus의 Freq_CSAT 등과 맞춤)
+        """
+        if callable(document_unit):
+            self.document_key = document_unit
+        elif document_unit in DOCUMENT_KEYS:
+            self.document_key = DOCUMENT_KEYS[document_unit]
+        else:
+            raise ValueError(f'document_unit must be one of {list(DOCUMENT_KEYS)} or a callable')
+
+        self.records = records
+        self.document_unit = document_unit
+        self.suffix = suffix
+
+        self.matrix = None      # 문서 x 단어 CSR 행렬
+        self.documents = None   # 행 index -> 문서 key
+        self.vocabulary = None  # 열 index -> 단어
+
+    def build_matrix(self) -> sparse.csr_matrix:
+        """문장 레코드로부터 희소 문서-단어 행렬(CSR) 생성"""
+        doc_keys, tokens = [], []
+        for record in self.records:
+            key = self.document_key(record)
+            doc_keys.extend([key] * len(record['tokens']))
+            tokens.extend(record['tokens'])
+
+        # 문서와 단어를 정수 index로 변환 (중복 (문서, 단어) 쌍은 csr 생성 시 합산됨)
+        doc_idx, self.documents = pd.factorize(pd.Series(doc_keys, dtype='object'))
+        word_idx, self.vocabulary = pd.factorize(pd.Series(tokens, dtype='object'))
+
+        counts = np.ones(len(tokens), dtype=np.int64)
+        self.matrix = sparse.csr_matrix(
+            (counts, (doc_idx, word_idx)),
+            shape=(len(self.documents), len(self.vocabulary))
+        )
+        self.matrix.sum_duplicates()
+        return self.matrix
+
+    def calculate_dispersion(self) -> pd.DataFrame:
+        """
+        모든 단어의 분산도 지표를 한 번에 계산 (행렬을 dense로 바꾸지 않고 0이 아닌 원소만 사용)
+
+        n: 문서 수, v_i: 문서 i에서의 빈도, f: 전체 빈도, s_i: 문서 i의 크기 비율, p_i = v_i / 문서 i의 토큰 수
+            Range      = v_i > 0 인 문서 수
+            DP         = 0.5 * sum_i |v_i / f - s_i|  (0: 고르게 분포, 1에 가까울수록 편중)
+            Juilland D = 1 - (sd(p) / mean(p)) / sqrt(n - 1)  (1: 고르게 분포, 0: 편중)
+            Adjusted   = D * f  (Juilland's U)
+        """
+        if self.matrix is None:
+            self.build_matrix()
+
+        n_docs, n_words = self.matrix.shape
+        doc_sizes = np.asarray(self.matrix.sum(axis=1)).ravel().astype(float)
+        size_ratio = doc_sizes / doc_sizes.sum()
+
+        # 0이 아닌 원소들의 (문서, 단어, 빈도)
+        coo = self.matrix.tocoo()
+        rows, cols, values = coo.row, coo.col, coo.data.astype(float)
+
+        freq = np.bincount(cols, weights=values, minlength=n_words)
+        word_range = np.bincount(cols, minlength=n_words)
+
+        # DP: 등장하지 않은 문서의 |0 - s_i| 합은 1 - (등장한 문서의 s_i 합)
+        observed_dev = np.abs(values / freq[cols] - size_ratio[rows])
+        observed_dev = np.bincount(cols, weights=observed_dev, minlength=n_words)
+        observed_size = np.bincount(cols, weights=size_ratio[rows], minlength=n_words)
+        dp = 0.5 * (observed_dev + (1.0 - observed_size))
+
+        # Juilland's D: 문서 크기로 정규화한 상대빈도의 변동계수 (등장하지 않은 문서는 0)
+        rel_freq = values / doc_sizes[rows]
+        mean = np.bincount(cols, weights=rel_freq, minlength=n_words) / n_docs
+        mean_sq = np.bincount(cols, weights=rel_freq ** 2, minlength=n_words) / n_docs
+        sd = np.sqrt(np.maximum(mean_sq - mean ** 2, 0.0))
+        if n_docs > 1:
+            juilland_d = 1.0 - (sd / mean) / np.sqrt(n_docs - 1)
+            juilland_d = np.clip(juilland_d, 0.0, 1.0)  # 부동소수점 오차 보정
+        else:
+            juilland_d = np.full(n_words, np.nan)   # 문서가 하나면 분산도를 정의할 수 없음
+
+        return pd.DataFrame({
+            'Word': np.asarray(self.vocabulary, dtype=object),
+            f'Range{self.suffix}': word_range,
+            f'Juilland_D{self.suffix}': juilland_d,
+            f'DP{self.suffix}': dp,
+            f'Adjusted_Freq{self.suffix}': juilland_d * freq,
+        })
+
+    def merge_into(self, df: pd.DataFrame, dispersion_df: pd.DataFrame = None) -> pd.DataFrame:
+        """merged_corpus 등 Word 컬럼이 있는 데이터프레임에 분산도 컬럼 추가 (left join)"""
+        if dispersion_df is None:
+            dispersion_df = self.calculate_dispersion()
+        return df.merge(dispersion_df, how='left', on='Word')
+
+
+def load_corpus_records(corpus_path: str) -> list:
+    """corpus 디렉토리 내 json 파일들의 문장 레코드를 모두 읽어옴"""
+    records = []
+    for file_name in sorted(os.listdir(corpus_path)):
+        if not file_name.endswith('.json'):
+            continue
+        with open(os.path.join(corpus_path, file_name), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if isinstance(data, list):  # 한 json 내에 여러 obj가 있는 경우
+            records.extend(data)
+        else:   # 한 json 내에 하나의 obj가 있는 경우
+            records.append(data)
+    return records
+
+
+# 사용 예시 함수
+def add_dispersion_columns(df, records, document_unit='passage', suffix='_CSAT'):
+    """
+    분산도 지표를 계산해서 df에 컬럼으로 추가하는 편의 함수
+
+    Parameters:
+    df: Word 컬럼이 있는 pandas DataFrame (예: merged_corpus)
+    records: corpus/*.json 문장 레코드 리스트
+    document_unit: 문서 단위 ('year', 'source', 'passage', 'unit') 또는 record -> key 함수
+    suffix: 결과 컬럼명 접미사
+    """
+    analyzer = DispersionAnalyzer(records, document_unit=document_unit, suffix=suffix)
+    return analyzer.merge_into(df)
+
+
+# 예시 사용법
+if __name__ == "__main__":
+    corpus_path = os.path.join(Path.cwd(), 'corpus')
+    records = load_corpus_records(corpus_path)
+
+    merged_corpus = pd.read_csv('merged_corpus.csv')
+    merged_corpus = add_dispersion_columns(merged_corpus, records, document_unit='passage')
+    merged_corpus.to_csv('merged_corpus_dispersion.csv', index=False)
+    print(merged_corpus.head())